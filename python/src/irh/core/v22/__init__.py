@@ -1,10 +1,11 @@
-from .cymatics import CymaticResonanceNetwork, ResonantNode
+from .cymatics import CymaticResonanceNetwork, ResonantNode, ResonantNodeView
 from .action import SymplecticAction, DissonanceFunctional
 from .cancellation import SymplecticCancellation
 
 __all__ = [
     'CymaticResonanceNetwork', 
     'ResonantNode', 
+    'ResonantNodeView',
     'SymplecticAction', 
     'DissonanceFunctional',
     'SymplecticCancellation'
@@ -1,7 +1,11 @@
 import numpy as np
-from typing import List, Callable
+from scipy import sparse
+from typing import List, Callable, Union
 from irh.verification import theoretical_reference, get_transparency_engine
 
+# Graph Laplacians are degree-bounded, so callers may pass them in sparse form.
+LaplacianLike = Union[np.ndarray, sparse.spmatrix, sparse.sparray]
+
 class SymplecticAction:
     """
     Implementation of the Symplectic Action S[φ, φ̄] (Sec. 2.2).
@@ -17,17 +21,21 @@ class SymplecticAction:
         equation="Sec. 2.2, Eq. 2",
         description="Kinetic Term (The Interference Matrix)"
     )
-    def compute_kinetic_term(self, phi: np.ndarray, laplacian: np.ndarray) -> float:
+    def compute_kinetic_term(self, phi: np.ndarray, laplacian: LaplacianLike) -> float:
         """
         S_kin = ∫ φ̄ [Σ Δ + m²] φ
-        Discrete: φ† · (L + m²I) · φ
+        Discrete: φ† · (L + m²I) · φ = φ†Lφ + m²|φ|²
+
+        The Laplacian may be dense or a scipy.sparse matrix; the sparse
+        matvec costs O(nnz) instead of O(n²).
         """
         # Assume mass m=1 for simplicity in this scaffold
         m_sq = 1.0
-        operator = laplacian + m_sq * np.eye(len(phi))
-        
-        # S_kin = <phi|Operator|phi>
-        s_kin = np.real(np.vdot(phi, operator @ phi))
+
+        # S_kin = <phi|L|phi> + m² <phi|phi>; the mass term is diagonal, so it is
+        # applied as a norm rather than by materializing L + m²I.
+        # Both reductions stay complex; the real part is taken once at the end.
+        s_kin = (np.vdot(phi, laplacian @ phi) + m_sq * np.vdot(phi, phi)).real
         
         self.transparency.log_theoretical_step(
             action="Compute Kinetic Action",
@@ -48,8 +56,11 @@ class SymplecticAction:
         Simplified for scaffold: λ * Σ |φ|^4
         """
         # Full symplectic kernel integration is complex; using simplified local interaction for scaffold
-        phi_sq = np.abs(phi)**2
-        s_int = self.lambda_coupling * np.sum(phi_sq**2)
+        # |φ|² from the components directly (np.abs would take a sqrt only to square it),
+        # then Σ |φ|⁴ as a single (flattening) dot product.
+        phi = np.asarray(phi)
+        phi_sq = phi.real**2 + phi.imag**2
+        s_int = self.lambda_coupling * np.vdot(phi_sq, phi_sq)
         
         self.transparency.log_theoretical_step(
             action="Compute Interaction Action",
@@ -59,7 +70,7 @@ class SymplecticAction:
         )
         return float(s_int)
 
-    def compute_total_action(self, phi: np.ndarray, laplacian: np.ndarray) -> float:
+    def compute_total_action(self, phi: np.ndarray, laplacian: LaplacianLike) -> float:
         return self.compute_kinetic_term(phi, laplacian) + self.compute_interaction_term(phi)
 
 
@@ -76,6 +87,6 @@ class DissonanceFunctional:
         equation="Axiom 1.1",
         description="Dissonance Functional Γ"
     )
-    def evaluate(self, phi: np.ndarray, laplacian: np.ndarray) -> float:
+    def evaluate(self, phi: np.ndarray, laplacian: LaplacianLike) -> float:
         # In this framework, Dissonance corresponds to the Action (principle of least action)
         return self.action.compute_total_action(phi, laplacian)
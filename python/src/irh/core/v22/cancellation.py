@@ -1,14 +1,21 @@
+import math
 import numpy as np
+from typing import Optional
 from irh.verification import theoretical_reference, get_transparency_engine
 
+# Samples drawn per batch in verify_cancellation; bounds peak memory for large runs.
+_SAMPLE_CHUNK = 1 << 20
+
 class SymplecticCancellation:
     """
     Verification of the Symplectic Cancellation Theorem (Theorem 3.1).
     Ensures non-planar diagrams vanish at the Cosmic Fixed Point.
     """
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.transparency = get_transparency_engine()
+        # PCG64 generator shared across checks; pass a seed for reproducible runs.
+        self.rng = np.random.default_rng(seed)
 
     @theoretical_reference(
         manuscript="IRH v22.1",
@@ -30,7 +37,15 @@ class SymplecticCancellation:
         -------
         bool
             True if contributions cancel (sum to ~0).
+
+        Raises
+        ------
+        ValueError
+            If num_samples is not positive.
         """
+        if num_samples <= 0:
+            raise ValueError(f"num_samples must be positive, got {num_samples}")
+
         if genus == 0:
             # Planar diagrams do NOT vanish
             return False
@@ -42,21 +57,28 @@ class SymplecticCancellation:
         # Simplified model: Sum of random phases e^{i θ_k} where distribution is symmetric
         # due to symplectic antisymmetry epsilon_ijk.
         
-        phases = np.random.uniform(0, 2*np.pi, num_samples)
-        # For non-planar, the crossing introduces signs.
-        # We model this by applying random signs to the amplitudes.
-        signs = np.random.choice([-1, 1], size=num_samples)
+        # Accumulate Σ s_k e^{i θ_k} chunk by chunk so no num_samples-sized complex
+        # array is ever built; cos/sin reductions avoid the complex exp entirely.
+        rng = self.rng
+        total_re = 0.0
+        total_im = 0.0
+        for start in range(0, num_samples, _SAMPLE_CHUNK):
+            size = min(_SAMPLE_CHUNK, num_samples - start)
+            phases = rng.uniform(0, 2*np.pi, size)
+            # For non-planar, the crossing introduces signs.
+            # We model this by applying random signs to the amplitudes.
+            signs = 2 * rng.integers(0, 2, size, dtype=np.int8) - 1
+            total_re += np.dot(signs, np.cos(phases))
+            total_im += np.dot(signs, np.sin(phases))
         
-        contributions = signs * np.exp(1j * phases)
-        total_amplitude = np.sum(contributions)
-        normalized_amplitude = np.abs(total_amplitude) / num_samples
+        normalized_amplitude = np.hypot(total_re, total_im) / num_samples
         
         # Threshold for "vanishing" in stochastic check
         # With N samples, random walk expects ~ 1/sqrt(N). 
         # Theorem 3.1 says it vanishes *identically* in the limit or via exact cancellation.
         # Here we verify statistical suppression.
         
-        threshold = 2.0 / np.sqrt(num_samples) # 2 sigma check
+        threshold = 2.0 / math.sqrt(num_samples) # 2 sigma check
         is_cancelled = normalized_amplitude < threshold
         
         self.transparency.log_theoretical_step(
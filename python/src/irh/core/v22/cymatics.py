@@ -1,9 +1,10 @@
 import numpy as np
+from scipy import sparse
 from typing import List, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from irh.verification import theoretical_reference, get_transparency_engine
 
-@dataclass
+@dataclass(slots=True)
 class ResonantNode:
     """
     A single node in the Cymatic Resonance Network.
@@ -36,6 +37,78 @@ class ResonantNode:
         self.state = np.exp(1j * self.phase)
 
 
+class ResonantNodeView:
+    """
+    Live view of one node of a CymaticResonanceNetwork.
+
+    State, frequency and phase are read from and written to the network's
+    contiguous arrays, so node-level and array-level access stay in sync.
+    Copying a view (or calling ``snapshot``) gives a detached ResonantNode.
+    """
+
+    __slots__ = ('_network', 'id')
+
+    def __init__(self, network: 'CymaticResonanceNetwork', id: int):
+        self._network = network
+        self.id = id
+
+    @property
+    def state(self) -> complex:
+        return complex(self._network._psi[self.id])
+
+    @state.setter
+    def state(self, value: complex) -> None:
+        self._network._psi[self.id] = value
+
+    @property
+    def frequency(self) -> float:
+        return float(self._network._freq[self.id])
+
+    @frequency.setter
+    def frequency(self, value: float) -> None:
+        self._network._freq[self.id] = value
+
+    @property
+    def phase(self) -> float:
+        return float(self._network._phase[self.id])
+
+    @phase.setter
+    def phase(self, value: float) -> None:
+        self._network._phase[self.id] = value
+
+    @theoretical_reference(
+        manuscript="IRH v22.1",
+        equation="Sec. 1.1",
+        description="Information is a physical state of oscillation."
+    )
+    def update_phase(self, dt: float) -> None:
+        """Evolve phase based on natural frequency: φ(t+dt) = φ(t) + ω*dt."""
+        self.phase = (self.phase + self.frequency * dt) % (2 * np.pi)
+        self.state = np.exp(1j * self.phase)
+
+    def snapshot(self) -> ResonantNode:
+        """Return a detached ResonantNode holding this node's current values."""
+        return ResonantNode(id=self.id, state=self.state, frequency=self.frequency, phase=self.phase)
+
+    def __copy__(self) -> ResonantNode:
+        return self.snapshot()
+
+    def __deepcopy__(self, memo: dict) -> ResonantNode:
+        return self.snapshot()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (ResonantNode, ResonantNodeView)):
+            return NotImplemented
+        return (self.id, self.state, self.frequency, self.phase) == \
+            (other.id, other.state, other.frequency, other.phase)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (f"ResonantNodeView(id={self.id!r}, state={self.state!r}, "
+                f"frequency={self.frequency!r}, phase={self.phase!r})")
+
+
 class CymaticResonanceNetwork:
     """
     Implementation of the Cymatic Resonance Network (Axiom 1).
@@ -43,21 +116,45 @@ class CymaticResonanceNetwork:
     """
     
     def __init__(self, num_nodes: int = 100):
-        self.nodes: List[ResonantNode] = [
-            ResonantNode(id=i, frequency=1.0 + np.random.normal(0, 0.1)) 
-            for i in range(num_nodes)
-        ]
-        self.coupling_matrix = np.zeros((num_nodes, num_nodes))
+        # Node data is stored as structure-of-arrays; self.nodes are views into it.
+        # The tuple is fixed-size so the node set cannot drift from the arrays.
+        self._freq = 1.0 + np.random.normal(0, 0.1, num_nodes)
+        self._phase = np.zeros(num_nodes)
+        self._psi = np.zeros(num_nodes, dtype=np.complex128)
+        self._tmp = np.empty(num_nodes)  # scratch buffer for update_phases
+        self.nodes: tuple[ResonantNodeView, ...] = tuple(ResonantNodeView(self, i) for i in range(num_nodes))
+        # No couplings yet; sparse storage keeps the empty matrix O(1) in memory.
+        # csr_array (not csr_matrix) keeps ndarray semantics: * is elementwise, @ is a product.
+        self.coupling_matrix = sparse.csr_array((num_nodes, num_nodes))
         self.transparency = get_transparency_engine()
 
+    @theoretical_reference(
+        manuscript="IRH v22.1",
+        equation="Sec. 1.1",
+        description="Information is a physical state of oscillation."
+    )
+    def update_phases(self, dt: float) -> None:
+        """
+        Evolve every node at once: φ(t+dt) = φ(t) + ω*dt, ψ = e^{iφ}.
+        Equivalent to calling ResonantNode.update_phase on each node.
+        """
+        tau = 2 * np.pi
+        np.multiply(self._freq, dt, out=self._tmp)
+        np.add(self._phase, self._tmp, out=self._phase)
+        np.fmod(self._phase, tau, out=self._phase)
+        # fmod keeps the dividend's sign; fold phases driven negative back into [0, 2π)
+        np.add(self._phase, tau, out=self._phase, where=self._phase < 0)
+        np.cos(self._phase, out=self._psi.real)
+        np.sin(self._phase, out=self._psi.imag)
+
     @theoretical_reference(
         manuscript="IRH v22.1",
         equation="Axiom 1.1",
         description="Collective wavefunction evolving to minimize Dissonance."
     )
     def get_collective_wavefunction(self) -> np.ndarray:
-        """Return the collective state vector Ψ."""
-        psi = np.array([node.state for node in self.nodes])
+        """Return the collective state vector Ψ (a copy of the network's state array)."""
+        psi = self._psi.copy()
         
         self.transparency.log_theoretical_step(
             action="Collective Wavefunction Extraction",
@@ -77,8 +174,7 @@ class CymaticResonanceNetwork:
         Check if the network spectrum supports stable solitons.
         Simplified check: variance of frequencies should be bounded.
         """
-        freqs = [n.frequency for n in self.nodes]
-        variance = np.var(freqs)
+        variance = float(self._freq.var())
         
         is_stable = variance < 0.5 # Placeholder threshold
         
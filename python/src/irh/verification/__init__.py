@@ -1,5 +1,29 @@
-from .annotations import theoretical_reference
-from .transparency import TransparencyEngine, get_transparency_engine
-from .uncertainty import UncertaintyValue
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .annotations import theoretical_reference
+    from .transparency import TransparencyEngine, get_transparency_engine
+    from .uncertainty import UncertaintyValue
 
 __all__ = ['theoretical_reference', 'TransparencyEngine', 'get_transparency_engine', 'UncertaintyValue']
+
+# Submodules are imported on first attribute access (PEP 562), so e.g. using
+# theoretical_reference does not load numpy or set up the transparency engine.
+_EXPORTS = {
+    'theoretical_reference': 'annotations',
+    'TransparencyEngine': 'transparency',
+    'get_transparency_engine': 'transparency',
+    'UncertaintyValue': 'uncertainty',
+}
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,19 @@
 import sys
+import math
+import time
+import functools
+import collections
 import logging
+import numpy as np
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
-@dataclass
+# Console echo formats for log_theoretical_step
+_STEP_FMT = "[EXEC] %s\n"
+_DETAIL_FMT = "  ├─ %s: %s\n"
+
+@dataclass(slots=True)
 class LogEntry:
     timestamp: datetime
     level: str
@@ -15,12 +24,75 @@ class TransparencyEngine:
     """
     Emits theoretical context logs during execution to ensure algorithmic transparency.
     """
-    def __init__(self, verbosity: int = 1):
+    def __init__(self, verbosity: int = 1, max_logs: int = 100_000):
         self.verbosity = verbosity
-        self.logs: list[LogEntry] = []
+        # Only the most recent max_logs steps are kept, so long runs use bounded memory.
+        self._max_logs = max_logs
+        self._entries: list[LogEntry] = []
+        # Steps recorded as (monotonic ns, message, details) and turned into
+        # LogEntry objects only when the logs are read; bounded so it never
+        # holds more than the entries that could be kept.
+        self._pending: collections.deque[tuple[int, str, Optional[Dict[str, Any]]]] = collections.deque(maxlen=max_logs)
+        # Wall-clock anchor for converting monotonic ticks to timestamps
+        self._epoch = time.time()
+        self._mono0 = time.monotonic_ns()
         logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
         self.logger = logging.getLogger("IRH_Transparency")
 
+    @property
+    def max_logs(self) -> int:
+        """Maximum number of steps retained; fixed at construction."""
+        return self._max_logs
+
+    @property
+    def logs(self) -> list[LogEntry]:
+        """Recorded steps, oldest first (at most max_logs)."""
+        if self._pending:
+            self.flush_logs()
+        return self._entries
+
+    @logs.setter
+    def logs(self, entries: list[LogEntry]) -> None:
+        # Assigning replaces everything recorded so far, pending steps included.
+        self._pending.clear()
+        self._entries = list(entries)
+        self._trim()
+
+    def get_logs(self) -> list[LogEntry]:
+        """Return a copy of the recorded steps."""
+        return list(self.logs)
+
+    def clear_logs(self) -> None:
+        """Discard all recorded and pending steps."""
+        self._pending.clear()
+        self._entries.clear()
+
+    def flush_logs(self) -> None:
+        """Materialize pending step records as LogEntry objects."""
+        for tick, msg, details in self._pending:
+            self._entries.append(LogEntry(
+                timestamp=datetime.fromtimestamp(self._epoch + (tick - self._mono0) / 1e9),
+                level="INFO",
+                message=msg,
+                context=details or {}
+            ))
+        self._pending.clear()
+        self._trim()
+
+    def _trim(self) -> None:
+        """
+        Keep only the newest max_logs entries.
+
+        Entries stay in a plain list so engine.logs supports slicing, which
+        makes dropping old entries a shift of up to max_logs pointers. It runs
+        once per flush rather than per step, so reading logs in batches keeps
+        the cost amortized; reading after every step at capacity pays it each
+        time.
+        """
+        excess = len(self._entries) - self._max_logs
+        if excess > 0:
+            del self._entries[:excess]
+
     def log_theoretical_step(self, 
                              action: str, 
                              manuscript_ref: str, 
@@ -36,40 +108,44 @@ class TransparencyEngine:
         """
         if self.verbosity > 0:
             msg = f"Computing {action} per {manuscript_ref}, {equation_ref}"
-            print(f"[EXEC] {msg}")
+            # One write per step instead of one print per line
+            lines = [_STEP_FMT % msg]
             if details:
-                for key, value in details.items():
-                    print(f"  ├─ {key}: {value}")
+                lines.extend([_DETAIL_FMT % item for item in details.items()])
+            sys.stdout.write("".join(lines))
             
-            self.logs.append(LogEntry(
-                timestamp=datetime.now(),
-                level="INFO",
-                message=msg,
-                context=details or {}
-            ))
+            self._pending.append((time.monotonic_ns(), msg, details))
 
     def verify_invariant(self, name: str, value: Any, expected: Any, tolerance: float = 1e-9) -> bool:
         """
         Verify a theoretical invariant holds.
         """
-        import numpy as np
-        
-        # Handle numpy arrays and floats
-        if isinstance(value, (float, int)) or (isinstance(value, np.ndarray) and value.size == 1):
-             is_valid = np.isclose(value, expected, atol=tolerance)
-             diff = abs(value - expected)
+        # Fast path for plain floats: same test as np.isclose(value, expected, atol=tolerance)
+        # (default rtol=1e-5) without building 0-d arrays.
+        if type(value) is float and type(expected) is float:
+            diff = abs(value - expected)
+            if math.isinf(value) or math.isinf(expected):
+                # np.isclose treats infinities as close only when equal
+                is_valid = value == expected
+            else:
+                is_valid = value == expected or diff <= tolerance + 1e-5 * abs(expected)
         else:
-             # Fallback for now
-             is_valid = value == expected
-             diff = 0.0
+            # Handle numpy arrays and floats
+            if isinstance(value, (float, int)) or (isinstance(value, np.ndarray) and value.size == 1):
+                is_valid = np.isclose(value, expected, atol=tolerance)
+                diff = abs(value - expected)
+            else:
+                # Fallback for now
+                is_valid = value == expected
+                diff = 0.0
 
-        status = "VERIFIED" if is_valid else "VIOLATED"
-        print(f"  └─ {name}: {status} (Expected {expected}, Got {value}, Diff {diff:.2e})")
+        if self.verbosity > 0:
+            status = "VERIFIED" if is_valid else "VIOLATED"
+            print(f"  └─ {name}: {status} (Expected {expected}, Got {value}, Diff {diff:.2e})")
         
         return bool(is_valid)
 
-# Global instance
-_engine = TransparencyEngine()
-
+# Global instance, created on first use; cache_clear() resets it (e.g. in tests).
+@functools.lru_cache(maxsize=1)
 def get_transparency_engine() -> TransparencyEngine:
-    return _engine
+    return TransparencyEngine()
@@ -1,8 +1,8 @@
 from dataclasses import dataclass
-from typing import Optional, Union
-import numpy as np
+from typing import Optional, Sequence, Union
+import math
 
-@dataclass
+@dataclass(slots=True)
 class UncertaintyValue:
     """
     Represents a value with associated uncertainty and theoretical provenance.
@@ -17,16 +17,34 @@ class UncertaintyValue:
     def __add__(self, other: Union['UncertaintyValue', float]) -> 'UncertaintyValue':
         if isinstance(other, UncertaintyValue):
             new_val = self.value + other.value
-            new_unc = np.sqrt(self.uncertainty**2 + other.uncertainty**2)
+            new_unc = math.sqrt(self.uncertainty**2 + other.uncertainty**2)
             return UncertaintyValue(new_val, new_unc, f"Combined({self.source}, {other.source})")
         else:
             return UncertaintyValue(self.value + other, self.uncertainty, self.source)
 
+    @classmethod
+    def sum(cls, values: Sequence['UncertaintyValue']) -> 'UncertaintyValue':
+        """
+        Sum independent values in one pass, adding uncertainties in quadrature.
+        Value and uncertainty match chaining ``+``, without the intermediate
+        objects; the source is a single flat ``Combined(a, b, c)`` label rather
+        than the nested ``Combined(Combined(a, b), c)`` that chaining builds.
+        Always returns a new object.
+        """
+        if not values:
+            raise ValueError("UncertaintyValue.sum requires at least one value")
+        if len(values) == 1:
+            v = values[0]
+            return cls(v.value, v.uncertainty, v.source)
+        total = math.fsum(v.value for v in values)
+        unc = math.sqrt(math.fsum(v.uncertainty * v.uncertainty for v in values))
+        return cls(total, unc, f"Combined({', '.join(v.source for v in values)})")
+
     def __mul__(self, other: Union['UncertaintyValue', float]) -> 'UncertaintyValue':
         if isinstance(other, UncertaintyValue):
             new_val = self.value * other.value
             # Relative uncertainty propagation
-            rel_unc = np.sqrt((self.uncertainty/self.value)**2 + (other.uncertainty/other.value)**2)
+            rel_unc = math.sqrt((self.uncertainty/self.value)**2 + (other.uncertainty/other.value)**2)
             new_unc = abs(new_val) * rel_unc
             return UncertaintyValue(new_val, new_unc, f"Combined({self.source}, {other.source})")
         else:
@@ -0,0 +1,50 @@
+import unittest
+import numpy as np
+from scipy import sparse
+from irh.core.v22.action import SymplecticAction
+
+class TestSymplecticAction(unittest.TestCase):
+    
+    def setUp(self):
+        # Ring-graph Laplacian: degree 2, so the sparse form is genuinely sparse
+        n = 16
+        adjacency = np.roll(np.eye(n), 1, axis=1) + np.roll(np.eye(n), -1, axis=1)
+        self.laplacian = np.diag(adjacency.sum(axis=1)) - adjacency
+        rng = np.random.default_rng(0)
+        self.phi = rng.normal(size=n) + 1j * rng.normal(size=n)
+        
+    def test_kinetic_term_matches_operator_form(self):
+        action = SymplecticAction()
+        operator = self.laplacian + np.eye(len(self.phi))
+        expected = np.real(np.vdot(self.phi, operator @ self.phi))
+        
+        self.assertAlmostEqual(action.compute_kinetic_term(self.phi, self.laplacian), expected)
+        
+    def test_kinetic_term_accepts_sparse_laplacian(self):
+        action = SymplecticAction()
+        dense = action.compute_kinetic_term(self.phi, self.laplacian)
+        
+        s_kin = action.compute_kinetic_term(self.phi, sparse.csr_matrix(self.laplacian))
+        self.assertIsInstance(s_kin, float)
+        self.assertAlmostEqual(s_kin, dense)
+        
+    def test_interaction_term(self):
+        action = SymplecticAction(lambda_coupling=2.0)
+        expected = 2.0 * np.sum(np.abs(self.phi)**4)
+        
+        self.assertAlmostEqual(action.compute_interaction_term(self.phi), expected)
+        
+    def test_interaction_term_accepts_array_like(self):
+        action = SymplecticAction(lambda_coupling=2.0)
+        self.assertAlmostEqual(action.compute_interaction_term([1.0, 2.0]), 2.0 * 17.0)
+        self.assertAlmostEqual(action.compute_interaction_term([1j, 1.0 + 1.0j]), 2.0 * 5.0)
+        
+    def test_interaction_term_multicomponent_field(self):
+        action = SymplecticAction(lambda_coupling=2.0)
+        for shape in [(6, 2), (3, 3)]:
+            phi = self.phi[:shape[0] * shape[1]].reshape(shape)
+            expected = 2.0 * np.sum(np.abs(phi)**4)
+            self.assertAlmostEqual(action.compute_interaction_term(phi), expected)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,8 @@ from irh.core.v22.cancellation import SymplecticCancellation
 class TestSymplecticCancellation(unittest.TestCase):
     
     def test_cancellation_planar_vs_nonplanar(self):
-        verifier = SymplecticCancellation()
+        # Fixed seed: the 2σ check below would otherwise fail ~2% of runs
+        verifier = SymplecticCancellation(seed=20251229)
         
         # Genus 0 (Planar) should NOT cancel
         is_cancelled_planar = verifier.verify_cancellation(genus=0)
@@ -16,6 +17,22 @@ class TestSymplecticCancellation(unittest.TestCase):
         is_cancelled_nonplanar = verifier.verify_cancellation(genus=1, num_samples=10000)
         self.assertTrue(is_cancelled_nonplanar)
         
+    def test_cancellation_rejects_non_positive_samples(self):
+        verifier = SymplecticCancellation(seed=0)
+        for num_samples in (0, -5):
+            with self.assertRaises(ValueError):
+                verifier.verify_cancellation(genus=1, num_samples=num_samples)
+        
+    def test_seeded_cancellation_is_reproducible(self):
+        from irh.verification import get_transparency_engine
+        engine = get_transparency_engine()
+        
+        residuals = []
+        for _ in range(2):
+            SymplecticCancellation(seed=1234).verify_cancellation(genus=1, num_samples=5000)
+            residuals.append(engine.logs[-1].context["residual_amplitude"])
+        self.assertEqual(residuals[0], residuals[1])
+        
     def test_beta_function_logging(self):
         verifier = SymplecticCancellation()
         # Just ensure it runs and logs
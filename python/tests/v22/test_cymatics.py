@@ -1,6 +1,10 @@
+import copy
+import dataclasses
+import sys
 import unittest
 import numpy as np
-from irh.core.v22.cymatics import CymaticResonanceNetwork, ResonantNode
+from scipy import sparse
+from irh.core.v22.cymatics import CymaticResonanceNetwork, ResonantNode, ResonantNodeView
 
 class TestCymatics(unittest.TestCase):
     
@@ -18,6 +22,72 @@ class TestCymatics(unittest.TestCase):
         self.assertEqual(len(net.nodes), 50)
         self.assertEqual(net.coupling_matrix.shape, (50, 50))
         
+    def test_coupling_matrix_set_and_use(self):
+        net = CymaticResonanceNetwork(num_nodes=4)
+        self.assertEqual(net.coupling_matrix.nnz, 0)
+        
+        # Ring couplings between neighbouring nodes
+        couplings = np.roll(np.eye(4), 1, axis=1) * 0.5
+        net.coupling_matrix = sparse.csr_array(couplings + couplings.T)
+        net.update_phases(0.3)
+        psi = net.get_collective_wavefunction()
+        
+        np.testing.assert_allclose(net.coupling_matrix @ psi, (couplings + couplings.T) @ psi)
+        # Elementwise product keeps ndarray semantics
+        self.assertEqual((net.coupling_matrix * np.ones(4)).shape, (4, 4))
+        weighted = net.coupling_matrix * np.ones((4, 4))
+        np.testing.assert_allclose(np.asarray(weighted.todense()), couplings + couplings.T)
+        
+    def test_network_nodes_are_read_only_views(self):
+        net = CymaticResonanceNetwork(num_nodes=3)
+        
+        with self.assertRaises(TypeError):
+            net.nodes[0] = ResonantNode(0, frequency=50.0)  # type: ignore[index]
+        with self.assertRaises(AttributeError):
+            net.nodes.append(ResonantNode(3))  # type: ignore[attr-defined]
+        
+        # Writes through a view land in the network's arrays
+        net.nodes[1].frequency = 50.0
+        net.nodes[1].update_phase(0.1)
+        self.assertFalse(net.check_spectral_stability())
+        self.assertAlmostEqual(net.get_collective_wavefunction()[1], np.exp(1j * 5.0))
+        
+    def test_node_view_copy_is_detached(self):
+        net = CymaticResonanceNetwork(num_nodes=3)
+        view = net.nodes[0]
+        
+        self.assertIsInstance(view, ResonantNodeView)
+        self.assertTrue(repr(view).startswith("ResonantNodeView(id=0,"))
+        
+        snap = copy.copy(view)
+        self.assertIsInstance(snap, ResonantNode)
+        self.assertEqual(snap, view)
+        snap.phase = 1.0
+        self.assertEqual(view.phase, 0.0)
+        
+        replaced = dataclasses.replace(view.snapshot(), phase=1.0)
+        self.assertEqual(replaced.phase, 1.0)
+        self.assertEqual(view.phase, 0.0)
+        
+    def test_node_view_has_no_unused_storage(self):
+        net = CymaticResonanceNetwork(num_nodes=1)
+        view = net.nodes[0]
+        
+        # Only the network reference and id are stored; node data lives in the arrays
+        self.assertFalse(hasattr(view, '__dict__'))
+        self.assertEqual(ResonantNodeView.__slots__, ('_network', 'id'))
+        self.assertLess(sys.getsizeof(view), sys.getsizeof(ResonantNode(0)))
+        
+    def test_network_update_phases_matches_per_node(self):
+        net = CymaticResonanceNetwork(num_nodes=20)
+        expected = [(n.phase + n.frequency * 7.5) % (2 * np.pi) for n in net.nodes]
+        
+        net.update_phases(7.5)
+        
+        for node, phase in zip(net.nodes, expected):
+            self.assertAlmostEqual(node.phase, phase)
+            self.assertAlmostEqual(node.state, np.exp(1j * phase))
+        
     def test_collective_wavefunction(self):
         net = CymaticResonanceNetwork(num_nodes=10)
         psi = net.get_collective_wavefunction()
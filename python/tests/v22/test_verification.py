@@ -1,5 +1,5 @@
 import unittest
-from irh.verification import theoretical_reference, get_transparency_engine, UncertaintyValue
+from irh.verification import theoretical_reference, get_transparency_engine, TransparencyEngine, UncertaintyValue
 
 class TestVerificationInfrastructure(unittest.TestCase):
     
@@ -14,6 +14,14 @@ class TestVerificationInfrastructure(unittest.TestCase):
         self.assertEqual(ref['equation'], "Eq. 1.0")
         self.assertIn("Theoretical Reference: Test Manuscript, Eq. 1.0", dummy_function.__doc__)
         
+    def test_theoretical_reference_returns_function_unwrapped(self):
+        def dummy_function():
+            return 42
+        
+        decorated = theoretical_reference("Test Manuscript", "Eq. 1.0")(dummy_function)
+        self.assertIs(decorated, dummy_function)
+        self.assertEqual(decorated(), 42)
+        
     def test_transparency_engine(self):
         engine = get_transparency_engine()
         engine.logs.clear()
@@ -24,6 +32,41 @@ class TestVerificationInfrastructure(unittest.TestCase):
         self.assertEqual(engine.logs[0].message, "Computing TestAction per Doc1, Eq1")
         self.assertEqual(engine.logs[0].context['key'], "value")
         
+    def test_transparency_engine_log_limit(self):
+        engine = TransparencyEngine(verbosity=1, max_logs=3)
+        with self.assertRaises(AttributeError):
+            engine.max_logs = 10  # type: ignore[misc]
+        for i in range(5):
+            engine.log_theoretical_step(f"Step{i}", "Doc1", "Eq1")
+        
+        self.assertEqual(len(engine.logs), 3)
+        self.assertEqual(engine.logs[0].message, "Computing Step2 per Doc1, Eq1")
+        self.assertEqual(engine.logs[-1].context, {})
+        self.assertEqual([log.message for log in engine.logs[-2:]],
+                         ["Computing Step3 per Doc1, Eq1", "Computing Step4 per Doc1, Eq1"])
+        
+        snapshot = engine.get_logs()
+        engine.clear_logs()
+        self.assertEqual(len(engine.logs), 0)
+        self.assertEqual(len(snapshot), 3)
+        
+        engine.log_theoretical_step("Step5", "Doc1", "Eq1")
+        engine.logs = []
+        self.assertEqual(len(engine.logs), 0)
+        
+    def test_verify_invariant(self):
+        engine = get_transparency_engine()
+        
+        self.assertTrue(engine.verify_invariant("float", 1.0 + 1e-12, 1.0))
+        self.assertFalse(engine.verify_invariant("float", 1.1, 1.0))
+        self.assertFalse(engine.verify_invariant("nan", float("nan"), float("nan")))
+        self.assertTrue(engine.verify_invariant("inf", float("inf"), float("inf")))
+        self.assertFalse(engine.verify_invariant("inf", 1.0, float("inf")))
+        self.assertFalse(engine.verify_invariant("inf", 1.0, float("-inf")))
+        self.assertFalse(engine.verify_invariant("inf", float("inf"), float("-inf")))
+        self.assertFalse(engine.verify_invariant("inf", float("-inf"), float("inf")))
+        self.assertTrue(engine.verify_invariant("int", 3, 3.0))
+        
     def test_uncertainty_propagation(self):
         u1 = UncertaintyValue(10.0, 1.0, "SourceA")
         u2 = UncertaintyValue(20.0, 2.0, "SourceB")
@@ -40,6 +83,22 @@ class TestVerificationInfrastructure(unittest.TestCase):
         # Rel uncertainties: 0.1 and 0.1 -> sqrt(0.01 + 0.01) = sqrt(0.02) approx 0.1414
         # Abs uncertainty: 200 * 0.1414 = 28.28
         self.assertAlmostEqual(u_prod.uncertainty, 28.28, places=1)
+        
+    def test_uncertainty_sum_matches_chained_addition(self):
+        values = [UncertaintyValue(float(i), 0.1 * i, f"S{i}") for i in range(1, 6)]
+        chained = values[0] + values[1] + values[2] + values[3] + values[4]
+        
+        total = UncertaintyValue.sum(values)
+        self.assertAlmostEqual(total.value, chained.value)
+        self.assertAlmostEqual(total.uncertainty, chained.uncertainty)
+        self.assertEqual(total.source, "Combined(S1, S2, S3, S4, S5)")
+        
+        single = UncertaintyValue.sum(values[:1])
+        self.assertIsNot(single, values[0])
+        self.assertEqual(single, values[0])
+        
+        with self.assertRaises(ValueError):
+            UncertaintyValue.sum([])
 
 if __name__ == '__main__':
     unittest.main()